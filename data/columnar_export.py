@@ -0,0 +1,177 @@
+"""
+Columnar streaming export of bulk generation results.
+
+Records are buffered per column and written as record batches, one JSON
+object per line. Categorical columns (elements, professions, cultures,
+social classes, ...) are dictionary encoded: every batch stores integer codes
+plus only the dictionary values that were new in that batch, like Arrow's
+delta dictionaries. Memory use is bounded by the batch size and the number of
+distinct categorical values, not by the number of generated records.
+
+Categorical values must be single strings or numbers, numeric values numbers
+or None; booleans are rejected in both. A civilisation with
+several backgrounds is written with one categorical column per background
+table rather than a list of backgrounds in one column.
+"""
+import json
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+MISSING = -1  # Code of a missing categorical value
+
+
+class ColumnarWriter:
+    """Writes generation records as dictionary encoded record batches.
+
+    Frequency histograms of the categorical columns are kept up to date while
+    writing, so they are available without reading the output again.
+    """
+
+    def __init__(self, path: Path, categorical: List[str], numeric: Optional[List[str]] = None,
+                 batch_size: int = 4096):
+        self.path = Path(path)
+        self.categorical = list(categorical)
+        self.numeric = list(numeric or [])
+        self.batch_size = batch_size
+        self.row_count = 0
+
+        self._dictionaries: Dict[str, Dict[Any, int]] = {column: {} for column in self.categorical}
+        self._written_sizes: Dict[str, int] = {column: 0 for column in self.categorical}
+        self._counts: Dict[str, array] = {column: array('q') for column in self.categorical}
+        self._missing: Dict[str, int] = {column: 0 for column in self.categorical}
+        self._codes: Dict[str, array] = {}
+        self._values: Dict[str, list] = {}
+        self._reset_buffers()
+        self._file = open(self.path, 'w', encoding='utf-8')
+
+    def _reset_buffers(self):
+        self._codes = {column: array('i') for column in self.categorical}
+        self._values = {column: [] for column in self.numeric}
+        self._buffered = 0
+
+    def write(self, record: Dict[str, Any]):
+        """Append a single record, flushing a batch when the buffer is full"""
+        # Check first, so a rejected record does not leave columns of unequal length
+        for column in self.categorical:
+            value = record.get(column)
+            # bool is an int subclass, True and 1 would share one dictionary code
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (str, int, float))):
+                raise TypeError(
+                    f"Categorical column {column} needs a string or number, "
+                    f"not {type(value).__name__}; use one column per table for multiple values")
+        for column in self.numeric:
+            value = record.get(column)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise TypeError(f"Numeric column {column} needs a number, not {type(value).__name__}")
+
+        for column in self.categorical:
+            value = record.get(column)
+            if value is None:
+                code = MISSING
+                self._missing[column] += 1
+            else:
+                dictionary = self._dictionaries[column]
+                code = dictionary.get(value)
+                if code is None:
+                    code = dictionary[value] = len(dictionary)
+                    self._counts[column].append(0)
+                self._counts[column][code] += 1
+            self._codes[column].append(code)
+
+        for column in self.numeric:
+            self._values[column].append(record.get(column))
+
+        self._buffered += 1
+        self.row_count += 1
+        if self._buffered >= self.batch_size:
+            self.flush()
+
+    def write_all(self, records: Iterable[Dict[str, Any]]):
+        """Append all records of an iterable, e.g. a generator producing civilisations"""
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """Write the buffered records as one record batch"""
+        if not self._buffered:
+            return
+
+        new_values = {}
+        for column, dictionary in self._dictionaries.items():
+            # Dicts keep insertion order, so new values are at the end
+            new_values[column] = list(dictionary)[self._written_sizes[column]:]
+            self._written_sizes[column] = len(dictionary)
+
+        batch = {
+            "length": self._buffered,
+            "dictionaries": new_values,
+            "columns": {
+                **{column: codes.tolist() for column, codes in self._codes.items()},
+                **self._values,
+            },
+        }
+        self._file.write(json.dumps(batch, ensure_ascii=False, separators=(",", ":")))
+        self._file.write("\n")
+        self._reset_buffers()
+
+    def histogram(self, column: str) -> Dict[Any, int]:
+        """Get the frequency of every value of a categorical column written so far"""
+        histogram = dict(zip(self._dictionaries[column], self._counts[column]))
+        if self._missing[column]:
+            histogram[None] = self._missing[column]
+        return histogram
+
+    def close(self):
+        """Flush remaining records and close the output file"""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_batches(path: Path) -> Iterator[Dict[str, Any]]:
+    """Read record batches one at a time, keeping categorical columns encoded.
+
+    Every yielded batch contains the full dictionaries up to that batch.
+    """
+    dictionaries: Dict[str, List[Any]] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            batch = json.loads(line)
+            for column, values in batch["dictionaries"].items():
+                dictionaries.setdefault(column, []).extend(values)
+            batch["dictionaries"] = dictionaries
+            yield batch
+
+
+def read_histograms(path: Path, columns: Optional[List[str]] = None) -> Dict[str, Dict[Any, int]]:
+    """Count value frequencies of categorical columns batch by batch.
+
+    Codes are counted directly, values are only looked up once per distinct code.
+    Raises ValueError for numeric or unknown columns.
+    """
+    code_counts: Dict[str, Counter] = {}
+    dictionaries: Dict[str, List[Any]] = {}
+    for batch in read_batches(path):
+        dictionaries = batch["dictionaries"]
+        if columns is not None and not code_counts:
+            invalid = [column for column in columns if column not in dictionaries]
+            if invalid:
+                raise ValueError(f"Not categorical columns: {', '.join(invalid)}")
+        for column in columns or dictionaries:
+            code_counts.setdefault(column, Counter()).update(batch["columns"][column])
+
+    histograms = {}
+    for column, counts in code_counts.items():
+        values = dictionaries[column]
+        histograms[column] = {
+            (None if code == MISSING else values[code]): count for code, count in counts.items()
+        }
+    return histograms
@@ -0,0 +1,211 @@
+"""
+Offline validation and compilation of random table files.
+
+Usage:
+    python -m data.table_compiler data/tables
+    python -m data.table_compiler resources/tables --check
+
+Every CSV file is linted in parallel against the dice sides declared in the
+directory's dice sides file. If no table has errors, the validated
+entries are written to the compiled cache that the runtime loader reads
+instead of parsing the CSV files at startup.
+"""
+import argparse
+import csv
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from data.table_format import (TABLE_COLUMNS, DEFAULT_DICE_SIDES, DICE_SIDES_FILE,
+                               COMPILED_TABLES_FILE, COMPILED_FORMAT_VERSION,
+                               read_declared_dice_sides, lint_dice_sides,
+                               hash_table_file)
+
+Entry = Tuple[int, int, str]
+
+
+@dataclass
+class TableReport:
+    """Result of linting a single table file"""
+    name: str
+    dice_sides: int
+    sha256: str = ""
+    entries: List[Entry] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+def lint_table(file_path: Path, dice_sides: int = DEFAULT_DICE_SIDES) -> TableReport:
+    """Validate a table file and collect its entries sorted by roll"""
+    file_path = Path(file_path)
+    report = TableReport(file_path.stem, dice_sides)
+
+    # Unreadable files are reported as errors of their table, the other tables are still linted
+    try:
+        report.sha256 = hash_table_file(file_path)
+        _lint_rows(file_path, report)
+    except UnicodeDecodeError as e:
+        report.errors.append(f"file is not valid UTF-8: {e}")
+        return report
+    except (OSError, csv.Error) as e:
+        report.errors.append(f"cannot read file: {e}")
+        return report
+
+    if not report.entries and not report.errors:
+        report.errors.append("table has no entries")
+
+    report.entries.sort()
+    _lint_ranges(report)
+    return report
+
+
+def _lint_rows(file_path: Path, report: TableReport):
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        header = reader.fieldnames or []
+        if header != TABLE_COLUMNS:
+            report.errors.append(
+                f"expected columns {', '.join(TABLE_COLUMNS)} but found {', '.join(header) or 'nothing'}")
+            return
+
+        for row in reader:
+            line = reader.line_num
+            entry = _lint_row(row, line, report.dice_sides, report.errors)
+            if entry is not None:
+                report.entries.append(entry)
+
+
+def _lint_row(row: Dict[str, str], line: int, dice_sides: int, errors: List[str]) -> Optional[Entry]:
+    if None in row:
+        errors.append(f"line {line}: too many values")
+        return None
+
+    rolls = []
+    for column in ("min_roll", "max_roll"):
+        value = (row[column] or "").strip()
+        try:
+            rolls.append(int(value))
+        except ValueError:
+            errors.append(f"line {line}: {column} is not an integer: {value!r}")
+    text = (row["text"] or "").strip()
+    if not text:
+        errors.append(f"line {line}: missing text")
+    if len(rolls) != 2 or not text:
+        return None
+
+    min_roll, max_roll = rolls
+    if min_roll > max_roll:
+        errors.append(f"line {line}: min_roll {min_roll} is greater than max_roll {max_roll}")
+        return None
+    if min_roll < 1 or max_roll > dice_sides:
+        errors.append(f"line {line}: range {min_roll}-{max_roll} is outside of 1-{dice_sides}")
+        return None
+    return min_roll, max_roll, text
+
+
+def _lint_ranges(report: TableReport):
+    """Report overlapping ranges and rolls not covered by any entry"""
+    next_roll = 1
+    previous: Optional[Entry] = None
+    for entry in report.entries:
+        min_roll, max_roll, text = entry
+        if min_roll < next_roll and previous is not None:
+            report.errors.append(
+                f"range {min_roll}-{max_roll} ({text}) overlaps {previous[0]}-{previous[1]} ({previous[2]})")
+        elif min_roll > next_roll:
+            report.errors.append(f"rolls {_format_range(next_roll, min_roll - 1)} are not covered")
+        if max_roll + 1 > next_roll:
+            next_roll = max_roll + 1
+            previous = entry
+    if report.entries and next_roll <= report.dice_sides:
+        report.errors.append(f"rolls {_format_range(next_roll, report.dice_sides)} are not covered")
+
+
+def _format_range(first: int, last: int) -> str:
+    return str(first) if first == last else f"{first}-{last}"
+
+
+def lint_tables(table_files: List[Path], dice_sides: Dict[str, int],
+                jobs: Optional[int] = None) -> List[TableReport]:
+    """Lint all table files in parallel, reports are returned in file order"""
+    sides = [dice_sides.get(path.stem, DEFAULT_DICE_SIDES) for path in table_files]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(lint_table, table_files, sides))
+
+
+def write_compiled_tables(reports: List[TableReport], output_path: Path):
+    """Write the validated entries of all tables to the compiled cache"""
+    compiled = {
+        "version": COMPILED_FORMAT_VERSION,
+        "tables": {
+            report.name: {
+                "dice_sides": report.dice_sides,
+                "sha256": report.sha256,
+                "entries": report.entries,
+            }
+            for report in reports
+        },
+    }
+    # Write to a temporary file first so the loader never sees a partial cache
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(compiled, f, ensure_ascii=False, separators=(",", ":"))
+    temp_path.replace(output_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate and compile random table files")
+    parser.add_argument("directory", nargs="?", default="data/tables",
+                        help="directory containing the table CSV files")
+    parser.add_argument("-o", "--output",
+                        help=f"compiled cache to write (default: DIRECTORY/{COMPILED_TABLES_FILE})")
+    parser.add_argument("-j", "--jobs", type=int, help="number of parallel workers")
+    parser.add_argument("--check", action="store_true", help="only lint, do not write the cache")
+    args = parser.parse_args(argv)
+
+    data_path = Path(args.directory)
+    table_files = sorted(data_path.glob("*.csv"))
+    if not table_files:
+        print(f"No table files found in {data_path}")
+        return 1
+
+    # The runtime loader reads the same declarations, so tables get the same dice
+    dice_sides_path = data_path / DICE_SIDES_FILE
+    try:
+        declared = read_declared_dice_sides(data_path)
+    except ValueError as e:
+        print(e)
+        return 1
+    dice_errors = lint_dice_sides(declared, [path.stem for path in table_files])
+    if dice_errors:
+        for error in dice_errors:
+            print(f"{dice_sides_path}: {error}")
+        return 1
+
+    reports = lint_tables(table_files, declared, args.jobs)
+
+    error_count = 0
+    for file_path, report in zip(table_files, reports):
+        for error in report.errors:
+            print(f"{file_path}: {error}")
+        error_count += len(report.errors)
+
+    if error_count:
+        print(f"{error_count} errors in {sum(not r.is_valid for r in reports)} of {len(reports)} tables")
+        return 1
+
+    print(f"{len(reports)} tables are valid")
+    if not args.check:
+        output_path = Path(args.output) if args.output else data_path / COMPILED_TABLES_FILE
+        write_compiled_tables(reports, output_path)
+        print(f"Compiled tables written to {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
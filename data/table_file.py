@@ -0,0 +1,48 @@
+import csv
+import json
+from pathlib import Path
+from typing import Dict
+from data.table_format import DEFAULT_DICE_SIDES, is_compiled_cache_current
+from domain.table import Table
+
+
+def read_table(file_path: Path, dice_factory, dice_sides: int = DEFAULT_DICE_SIDES) -> Table:
+    """Read a random table CSV file and create a Table object"""
+    file_path = Path(file_path)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+
+        table = Table(file_path.stem, dice_factory.create_dice(dice_sides))
+
+        for row in reader:
+            min_roll = int(row['min_roll'])
+            max_roll = int(row['max_roll'])
+            text = row['text']
+            table.add_entry(min_roll, max_roll, text)
+
+    return table
+
+
+def read_compiled_tables(compiled_path: Path, dice_factory,
+                         dice_sides: Dict[str, int]) -> Dict[str, Table]:
+    """Create Table objects from a cache written by the table compiler.
+
+    The compiler already validated every entry, so the entries are not checked
+    again. Raises ValueError if the cache is outdated or was written by another
+    version of the compiler. The dice sides are the currently declared ones,
+    which must match the sides the cache was compiled with.
+    """
+    compiled_path = Path(compiled_path)
+    with open(compiled_path, 'r', encoding='utf-8') as f:
+        compiled = json.load(f)
+
+    if not is_compiled_cache_current(compiled, compiled_path.parent, dice_sides):
+        raise ValueError(f"Compiled tables in {compiled_path} are outdated")
+
+    tables = {}
+    for table_name, compiled_table in compiled["tables"].items():
+        table = Table(table_name, dice_factory.create_dice(compiled_table["dice_sides"]))
+        for min_roll, max_roll, text in compiled_table["entries"]:
+            table.add_entry(min_roll, max_roll, text)
+        tables[table_name] = table
+    return tables
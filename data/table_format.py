@@ -0,0 +1,92 @@
+"""
+Format of the random table files and of the compiled table cache
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+TABLE_COLUMNS = ["min_roll", "max_roll", "text"]
+DEFAULT_DICE_SIDES = 100  # Used for every table not declared in the dice sides file
+
+# Optional JSON object in the table directory mapping table names to dice sides,
+# e.g. {"elements": 12}. Read by the compiler and the runtime loader alike.
+DICE_SIDES_FILE = "dice_sides.json"
+
+# Compiled cache written by data.table_compiler and read by the runtime loader
+COMPILED_TABLES_FILE = "tables.compiled.json"
+COMPILED_FORMAT_VERSION = 2
+
+
+def read_declared_dice_sides(data_path: Path) -> Dict[str, int]:
+    """Read the dice sides declared for tables in a table directory"""
+    dice_sides_path = Path(data_path) / DICE_SIDES_FILE
+    if not dice_sides_path.exists():
+        return {}
+    with open(dice_sides_path, 'r', encoding='utf-8') as f:
+        try:
+            declared = json.load(f)
+        except ValueError as e:
+            raise ValueError(f"{dice_sides_path} is not valid JSON: {e}")
+    if not isinstance(declared, dict):
+        raise ValueError(f"{dice_sides_path} must map table names to dice sides")
+    return declared
+
+
+def is_valid_dice_sides(sides: Any) -> bool:
+    """Check that declared dice sides are a positive integer"""
+    return isinstance(sides, int) and not isinstance(sides, bool) and sides >= 1
+
+
+def lint_dice_sides(declared: Dict[str, Any], table_names: List[str]) -> List[str]:
+    """Validate the declared dice sides of a table directory"""
+    errors = []
+    for name, sides in declared.items():
+        if name not in table_names:
+            errors.append(f"dice sides declared for unknown table {name}")
+        elif not is_valid_dice_sides(sides):
+            errors.append(f"dice sides of {name} must be a positive integer: {sides!r}")
+    return errors
+
+
+def load_dice_sides(data_path: Path) -> Tuple[Dict[str, int], List[str]]:
+    """Read the declared dice sides for the runtime loader without raising.
+
+    Returns the valid declarations and the problems found. Tables with a broken
+    or invalid declaration use DEFAULT_DICE_SIDES.
+    """
+    try:
+        declared = read_declared_dice_sides(data_path)
+    except (OSError, ValueError) as e:
+        return {}, [str(e)]
+    valid = {name: sides for name, sides in declared.items() if is_valid_dice_sides(sides)}
+    errors = [f"dice sides of {name} must be a positive integer: {sides!r}"
+              for name, sides in declared.items() if name not in valid]
+    return valid, errors
+
+
+def hash_table_file(file_path: Path) -> str:
+    """Hash the content of a table file to detect edits after compiling"""
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def is_compiled_cache_current(compiled: Dict[str, Any], data_path: Path,
+                              dice_sides: Dict[str, int]) -> bool:
+    """Check that a compiled cache was built from the current table files and dice sides.
+
+    Only hashes the files, nothing is parsed.
+    """
+    if compiled.get("version") != COMPILED_FORMAT_VERSION:
+        return False
+    data_path = Path(data_path)
+    table_files = {path.stem: path for path in data_path.glob("*.csv")}
+    tables = compiled["tables"]
+    if set(table_files) != set(tables):
+        return False
+    for name, compiled_table in tables.items():
+        if compiled_table["dice_sides"] != dice_sides.get(name, DEFAULT_DICE_SIDES):
+            return False
+        if compiled_table["sha256"] != hash_table_file(table_files[name]):
+            return False
+    return True
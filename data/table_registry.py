@@ -0,0 +1,58 @@
+from PySide6.QtCore import QObject, Signal
+from threading import Lock
+from typing import Dict, Optional
+
+
+class TableRegistry(QObject):
+    """Shared registry of the loaded random tables.
+
+    The tables are kept in a dictionary that is never mutated once published.
+    Updates build a new dictionary and swap the reference, so readers always see
+    either the old or the new version of a table, never a half-loaded one.
+
+    Subscribers must handle all three signals: table_updated and table_removed
+    for single tables, and tables_replaced when the whole set was replaced,
+    which may add and remove tables without any per-table signal.
+    """
+
+    # Signals emitted with the table name after the swap
+    table_updated = Signal(str)
+    table_removed = Signal(str)
+    tables_replaced = Signal()  # Emitted once when all tables were published
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tables: Dict[str, object] = {}
+        self._lock = Lock()  # Serializes writers, readers never block
+
+    def get(self, name: str) -> Optional[object]:
+        """Get the current version of a table by name"""
+        return self._tables.get(name)
+
+    def snapshot(self) -> Dict[str, object]:
+        """Get a consistent copy of all current tables"""
+        return dict(self._tables)
+
+    def replace_all(self, tables: Dict[str, object]):
+        """Publish a complete set of tables, e.g. after the initial load"""
+        with self._lock:
+            self._tables = dict(tables)
+        self.tables_replaced.emit()
+
+    def replace(self, name: str, table: object):
+        """Atomically publish a new version of a single table"""
+        with self._lock:
+            tables = dict(self._tables)
+            tables[name] = table
+            self._tables = tables
+        self.table_updated.emit(name)
+
+    def remove(self, name: str):
+        """Atomically remove a table"""
+        with self._lock:
+            if name not in self._tables:
+                return
+            tables = dict(self._tables)
+            del tables[name]
+            self._tables = tables
+        self.table_removed.emit(name)
@@ -0,0 +1,137 @@
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+from data.table_format import DICE_SIDES_FILE, DEFAULT_DICE_SIDES, load_dice_sides
+from data.table_registry import TableRegistry
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+
+
+class TableWatcher(QObject):
+    """Watches a table directory and hot reloads changed tables.
+
+    Only a table whose file actually changed (by modification time and size) is
+    parsed again and swapped into the registry; all other tables are left
+    untouched. Editors often write a file in several steps, so changes are
+    collected for a short debounce interval before reloading.
+
+    The dice sides file is watched as well. Editing it reloads every table
+    whose declared dice sides changed, even if its own file did not.
+    """
+
+    # Signal emitted with table name and error message if a reload fails
+    reload_failed = Signal(str, str)
+
+    def __init__(self, registry: TableRegistry, data_dir: str,
+                 load_table: Callable[[Path, int], object], debounce_ms: int = 200, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        self.data_path = Path(data_dir)
+        self.load_table = load_table  # Called with the file path and dice sides
+        self._dice_sides_path = self.data_path / DICE_SIDES_FILE
+        self._dice_sides: Dict[str, int] = {}
+        self._signatures: Dict[Path, Tuple[int, int]] = {}
+        self._pending: Set[Path] = set()
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_path_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self.reload_pending)
+
+    def start(self):
+        """Start watching, taking the current files as the loaded state"""
+        self._watcher.addPath(str(self.data_path))
+        self._dice_sides = self._load_dice_sides()
+        if self._dice_sides_path.exists():
+            self._watcher.addPath(str(self._dice_sides_path))
+        for file_path in self._table_files():
+            self._signatures[file_path] = self._signature(file_path)
+            self._watcher.addPath(str(file_path))
+
+    def stop(self):
+        """Stop watching all files"""
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+        self._timer.stop()
+        self._pending.clear()
+
+    def _table_files(self) -> Set[Path]:
+        return set(self.data_path.glob("*.csv"))
+
+    @staticmethod
+    def _signature(file_path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _on_path_changed(self, path: str):
+        self._pending.add(Path(path))
+        self._timer.start()
+
+    def _on_directory_changed(self, path: str):
+        # Files were added, removed or replaced (e.g. editors saving via rename)
+        self._pending.update(self._table_files() | set(self._signatures))
+        self._pending.add(self._dice_sides_path)
+        self._timer.start()
+
+    def reload_pending(self):
+        """Reload all tables whose files or dice sides changed since the last reload"""
+        pending, self._pending = self._pending, set()
+        forced = set()
+        if self._dice_sides_path in pending:
+            pending.discard(self._dice_sides_path)
+            forced = self._reload_dice_sides()
+        for file_path in sorted(pending | forced):
+            self._reload(file_path, force=file_path in forced)
+
+    def _load_dice_sides(self) -> Dict[str, int]:
+        dice_sides, errors = load_dice_sides(self.data_path)
+        for error in errors:
+            print(f"Using d{DEFAULT_DICE_SIDES} instead of declared dice sides: {error}")
+            self.reload_failed.emit(self._dice_sides_path.stem, error)
+        return dice_sides
+
+    def _reload_dice_sides(self) -> Set[Path]:
+        """Read the dice sides again and return the table files whose sides changed"""
+        if self._dice_sides_path.exists() and str(self._dice_sides_path) not in self._watcher.files():
+            self._watcher.addPath(str(self._dice_sides_path))
+
+        old_dice_sides, self._dice_sides = self._dice_sides, self._load_dice_sides()
+        changed = {
+            name for name in set(old_dice_sides) | set(self._dice_sides)
+            if old_dice_sides.get(name, DEFAULT_DICE_SIDES) != self._dice_sides.get(name, DEFAULT_DICE_SIDES)
+        }
+        return {file_path for file_path in self._signatures if file_path.stem in changed}
+
+    def _reload(self, file_path: Path, force: bool = False):
+        table_name = file_path.stem
+        signature = self._signature(file_path)
+
+        if signature is None:
+            # File was deleted
+            if self._signatures.pop(file_path, None) is not None:
+                self.registry.remove(table_name)
+            return
+
+        # Replaced files drop out of the watcher, so always re-add them
+        if str(file_path) not in self._watcher.files():
+            self._watcher.addPath(str(file_path))
+
+        if not force and self._signatures.get(file_path) == signature:
+            return  # Unchanged table, do not touch it
+
+        try:
+            table = self.load_table(file_path, self._dice_sides.get(table_name, DEFAULT_DICE_SIDES))
+        except Exception as e:
+            # Keep the previous version of the table
+            print(f"Failed to reload table {table_name}: {e}")
+            self.reload_failed.emit(table_name, str(e))
+            return
+
+        self._signatures[file_path] = signature
+        self.registry.replace(table_name, table)
@@ -0,0 +1,104 @@
+import re
+from bisect import bisect_left
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower case search tokens"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class HistoryEntry(NamedTuple):
+    turn: int
+    text: str
+
+
+class EventLog:
+    """Append-only event history of a civilisation or leader.
+
+    Entries are never modified or removed, so an entry's position is stable and
+    can be used as its id. Every appended entry is added to an inverted index
+    (token -> ascending list of positions), which lets searches intersect the
+    posting lists of the query tokens instead of scanning the whole history.
+    Query words match as prefixes, found by binary search in the sorted list
+    of known tokens, so results show up while a word is still being typed.
+    New tokens are only merged into that list on the next search, which keeps
+    appending O(1) however large the vocabulary grows.
+    """
+
+    def __init__(self):
+        self._entries: List[HistoryEntry] = []
+        self._index: Dict[str, List[int]] = {}
+        self._tokens: List[str] = []  # Sorted tokens of the index
+        self._new_tokens: List[str] = []  # Tokens not merged into _tokens yet
+
+    def append(self, turn: int, text: str) -> int:
+        """Append an entry and return its position"""
+        position = len(self._entries)
+        self._entries.append(HistoryEntry(turn, text))
+        # Positions only grow, so every posting list stays sorted
+        for token in set(tokenize(text)):
+            posting = self._index.get(token)
+            if posting is None:
+                posting = self._index[token] = []
+                self._new_tokens.append(token)
+            posting.append(position)
+        return position
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, position: int) -> HistoryEntry:
+        return self._entries[position]
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        return iter(self._entries)
+
+    def matches(self, position: int, query: str) -> bool:
+        """Check if the entry at a position has a word starting with every query word"""
+        tokens = set(tokenize(self._entries[position].text))
+        return all(any(token.startswith(prefix) for token in tokens)
+                   for prefix in tokenize(query))
+
+    def search(self, query: str) -> Optional[List[int]]:
+        """Return the ascending positions of entries with a word starting with every query word.
+
+        Returns None for a query without tokens, meaning "no filter".
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return None
+
+        postings = [self._prefix_positions(token) for token in tokens]
+        postings.sort(key=len)
+        if not postings[0]:
+            return []
+
+        # Walk the rarest token's postings and binary search the others
+        return [position for position in postings[0]
+                if all(_contains(posting, position) for posting in postings[1:])]
+
+    def _prefix_positions(self, prefix: str) -> List[int]:
+        """Return the ascending positions of entries with a token starting with the prefix"""
+        if self._new_tokens:
+            # Timsort merges the sorted run with the sorted new tokens in linear time
+            self._new_tokens.sort()
+            self._tokens.extend(self._new_tokens)
+            self._tokens.sort()
+            self._new_tokens = []
+
+        start = bisect_left(self._tokens, prefix)
+        end = start
+        while end < len(self._tokens) and self._tokens[end].startswith(prefix):
+            end += 1
+        if end - start == 1:
+            return self._index[self._tokens[start]]
+        return sorted({position for token in self._tokens[start:end]
+                       for position in self._index[token]})
+
+
+def _contains(posting: List[int], position: int) -> bool:
+    i = bisect_left(posting, position)
+    return i < len(posting) and posting[i] == position
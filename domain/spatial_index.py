@@ -0,0 +1,133 @@
+import heapq
+import math
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+Cell = Tuple[int, int]
+
+
+class SpatialIndex:
+    """Uniform grid index over points for radius and k-nearest queries.
+
+    Each point is stored in the grid cell containing it, so inserting and
+    removing are O(1) and queries only look at cells near the query point
+    instead of every point. The cell size should be roughly the typical query
+    radius.
+    """
+
+    def __init__(self, cell_size: float = 10.0):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._positions: Dict[Hashable, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def position(self, key: Hashable) -> Tuple[float, float]:
+        """Get the position of a point"""
+        return self._positions[key]
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def insert(self, key: Hashable, x: float, y: float):
+        """Add a point, or move it if the key already exists"""
+        if key in self._positions:
+            self.remove(key)
+        self._positions[key] = (x, y)
+        self._cells.setdefault(self._cell(x, y), set()).add(key)
+
+    def remove(self, key: Hashable):
+        """Remove a point"""
+        x, y = self._positions.pop(key)
+        cell = self._cell(x, y)
+        keys = self._cells[cell]
+        keys.discard(key)
+        if not keys:
+            del self._cells[cell]
+
+    def within(self, x: float, y: float, radius: float,
+               predicate: Optional[Callable[[Hashable], bool]] = None) -> List[Tuple[float, Hashable]]:
+        """Get (distance, key) of all points within a radius, nearest first"""
+        min_cx, min_cy = self._cell(x - radius, y - radius)
+        max_cx, max_cy = self._cell(x + radius, y + radius)
+
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self._cells):
+            # Sparse grid, visit the occupied cells inside the box instead of every cell
+            cells = [keys for (cx, cy), keys in self._cells.items()
+                     if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy]
+        else:
+            cells = [self._cells.get((cx, cy), ())
+                     for cx in range(min_cx, max_cx + 1)
+                     for cy in range(min_cy, max_cy + 1)]
+
+        result = []
+        for keys in cells:
+            for key in keys:
+                if predicate is not None and not predicate(key):
+                    continue
+                px, py = self._positions[key]
+                distance = math.hypot(px - x, py - y)
+                if distance <= radius:
+                    result.append((distance, key))
+        result.sort(key=lambda item: item[0])
+        return result
+
+    def nearest(self, x: float, y: float, k: int,
+                predicate: Optional[Callable[[Hashable], bool]] = None) -> List[Tuple[float, Hashable]]:
+        """Get (distance, key) of the k nearest points, nearest first"""
+        if k <= 0:
+            return []
+
+        center_x, center_y = self._cell(x, y)
+        best: List[Tuple[float, int, Hashable]] = []  # Max heap of negative distances
+        seen = 0
+        ring = 0
+        counter = 0  # Tie breaker, keys need not be comparable
+        while seen < len(self._positions):
+            if (2 * ring + 1) ** 2 > 4 * len(self._cells):
+                # Sparse grid, visiting empty cells costs more than a full scan
+                return self._nearest_scan(x, y, k, predicate)
+            for cell in self._ring_cells(center_x, center_y, ring):
+                for key in self._cells.get(cell, ()):
+                    seen += 1
+                    if predicate is not None and not predicate(key):
+                        continue
+                    px, py = self._positions[key]
+                    distance = math.hypot(px - x, py - y)
+                    counter += 1
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, counter, key))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, counter, key))
+
+            # Points in further rings are at least this far away
+            if len(best) == k and -best[0][0] <= ring * self.cell_size:
+                break
+            ring += 1
+
+        return [(-distance, key) for distance, _, key in sorted(best, reverse=True)]
+
+    def _nearest_scan(self, x: float, y: float, k: int,
+                      predicate: Optional[Callable[[Hashable], bool]]) -> List[Tuple[float, Hashable]]:
+        candidates = (
+            (math.hypot(px - x, py - y), key) for key, (px, py) in self._positions.items()
+            if predicate is None or predicate(key)
+        )
+        return heapq.nsmallest(k, candidates, key=lambda item: item[0])
+
+    @staticmethod
+    def _ring_cells(center_x: int, center_y: int, ring: int):
+        if ring == 0:
+            yield center_x, center_y
+            return
+        for cx in range(center_x - ring, center_x + ring + 1):
+            yield cx, center_y - ring
+            yield cx, center_y + ring
+        for cy in range(center_y - ring + 1, center_y + ring):
+            yield center_x - ring, cy
+            yield center_x + ring, cy
@@ -0,0 +1,134 @@
+from PySide6.QtCore import QObject, Signal
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+WAR_VICTORY = "war"
+TRANSCENDENCE_VICTORY = "transcendence"
+CULTURAL_VICTORY = "cultural"
+
+
+@dataclass
+class CivilisationStatus:
+    """Counters of a single civilisation that victory conditions depend on"""
+    base_count: int = 0
+    tech_count: int = 0
+    outgoing_pressure: float = 0.0
+    destroyed: bool = False
+
+
+class VictoryTracker(QObject):
+    """Keeps victory and elimination conditions up to date incrementally.
+
+    Instead of scanning every civilisation and base at the end of a turn, the
+    game reports each change of base ownership, cultural pressure and technology
+    here. Every update adjusts a few counters and checks only the conditions it
+    can affect, emitting a signal the moment a condition is met. The turn loop
+    and screens subscribe to the signals instead of polling.
+    """
+
+    # Signals
+    civilisation_destroyed = Signal(str)  # Civilisation lost its last base
+    victory = Signal(str, str)  # Civilisation name and victory kind
+    all_destroyed = Signal()  # Game ended without a winner
+
+    def __init__(self, transcendence_techs: int = 50, cultural_pressure: float = 1000.0, parent=None):
+        super().__init__(parent)
+        self.transcendence_techs = transcendence_techs
+        self.cultural_pressure = cultural_pressure
+        self._civilisations: Dict[str, CivilisationStatus] = {}
+        self._pressure_on: Dict[str, Dict[str, float]] = {}  # Target -> source -> pressure
+        self._alive_count = 0
+        self.winner: Optional[Tuple[str, str]] = None
+        self.is_game_over = False
+
+    def add_civilisation(self, name: str, base_count: int = 1):
+        """Register a civilisation with its starting bases"""
+        if name in self._civilisations:
+            raise ValueError(f"Civilisation {name} already registered")
+        if base_count < 1:
+            raise ValueError("A civilisation needs at least one base")
+        self._civilisations[name] = CivilisationStatus(base_count=base_count)
+        self._alive_count += 1
+
+    def status(self, name: str) -> CivilisationStatus:
+        """Get the current counters of a civilisation"""
+        return self._civilisations[name]
+
+    @property
+    def alive_count(self) -> int:
+        return self._alive_count
+
+    def base_founded(self, name: str):
+        """A civilisation founded a new base"""
+        self._alive_status(name).base_count += 1
+
+    def base_destroyed(self, name: str):
+        """A base of a civilisation was destroyed"""
+        self._lose_base(name)
+
+    def base_captured(self, old_owner: str, new_owner: str):
+        """A base changed its owner"""
+        new_status = self._alive_status(new_owner)
+        old_status = self._alive_status(old_owner)
+        new_status.base_count += 1
+        self._lose_base(old_owner, old_status)
+
+    def tech_learned(self, name: str, count: int = 1):
+        """A civilisation understood new technologies"""
+        status = self._alive_status(name)
+        status.tech_count += count
+        if status.tech_count >= self.transcendence_techs:
+            self._declare_victory(name, TRANSCENDENCE_VICTORY)
+
+    def set_pressure(self, source: str, target: str, value: float):
+        """Set the cultural pressure one civilisation exerts on another"""
+        status = self._alive_status(source)
+        self._alive_status(target)
+        if source == target:
+            raise ValueError(f"Civilisation {source} cannot pressure itself")
+        pressure_on_target = self._pressure_on.setdefault(target, {})
+        previous = pressure_on_target.get(source, 0.0)
+        pressure_on_target[source] = value
+        status.outgoing_pressure += value - previous
+        if status.outgoing_pressure >= self.cultural_pressure:
+            self._declare_victory(source, CULTURAL_VICTORY)
+
+    def _alive_status(self, name: str) -> CivilisationStatus:
+        status = self._civilisations.get(name)
+        if status is None:
+            raise ValueError(f"Civilisation {name} not registered")
+        if status.destroyed:
+            raise ValueError(f"Civilisation {name} is destroyed")
+        return status
+
+    def _lose_base(self, name: str, status: Optional[CivilisationStatus] = None):
+        if status is None:
+            status = self._alive_status(name)
+        status.base_count -= 1
+        if status.base_count > 0:
+            return
+
+        status.destroyed = True
+        self._alive_count -= 1
+        # Pressure from and on a destroyed civilisation no longer counts
+        status.outgoing_pressure = 0.0
+        for source, value in self._pressure_on.pop(name, {}).items():
+            self._civilisations[source].outgoing_pressure -= value
+        for pressure_on_target in self._pressure_on.values():
+            pressure_on_target.pop(name, None)
+        self.civilisation_destroyed.emit(name)
+
+        if self._alive_count == 0:
+            if not self.is_game_over:
+                self.is_game_over = True
+                self.all_destroyed.emit()
+        elif self._alive_count == 1 and len(self._civilisations) > 1:
+            survivor = next(civ for civ, s in self._civilisations.items() if not s.destroyed)
+            self._declare_victory(survivor, WAR_VICTORY)
+
+    def _declare_victory(self, name: str, kind: str):
+        if self.is_game_over:
+            return
+        self.is_game_over = True
+        self.winner = (name, kind)
+        self.victory.emit(name, kind)
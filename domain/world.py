@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from domain.spatial_index import SpatialIndex
+from domain.victory_tracker import VictoryTracker
+
+
+@dataclass
+class Base:
+    """A base of a civilisation on the map"""
+    name: str
+    owner: str
+    x: float
+    y: float
+
+
+class World:
+    """All bases on the map and their owners.
+
+    Every change of a base goes through this class, which keeps the spatial
+    index used for neighbour and target queries and the optional victory
+    tracker up to date incrementally.
+    """
+
+    def __init__(self, victory_tracker: Optional[VictoryTracker] = None, cell_size: float = 10.0):
+        self.victory_tracker = victory_tracker
+        self._bases: Dict[str, Base] = {}
+        self._bases_by_owner: Dict[str, Set[str]] = {}
+        self._index = SpatialIndex(cell_size)
+
+    def add_civilisation(self, name: str, base_name: str, x: float, y: float) -> Base:
+        """Add a civilisation together with its first base"""
+        if name in self._bases_by_owner:
+            raise ValueError(f"Civilisation {name} already exists")
+        self._check_new_base_name(base_name)
+        if self.victory_tracker is not None:
+            self.victory_tracker.add_civilisation(name)
+        self._bases_by_owner[name] = set()
+        return self._add_base(base_name, name, x, y)
+
+    def found_base(self, base_name: str, owner: str, x: float, y: float) -> Base:
+        """A civilisation founds a new base"""
+        self._living_bases(owner)
+        self._check_new_base_name(base_name)
+        if self.victory_tracker is not None:
+            self.victory_tracker.base_founded(owner)
+        return self._add_base(base_name, owner, x, y)
+
+    def capture_base(self, base_name: str, new_owner: str) -> Base:
+        """A base is captured by another civilisation"""
+        base = self.base(base_name)
+        old_owner = base.owner
+        if old_owner == new_owner:
+            raise ValueError(f"Base {base_name} is already owned by {new_owner}")
+        self._living_bases(new_owner).add(base_name)
+        self._bases_by_owner[old_owner].discard(base_name)
+        base.owner = new_owner
+        # Update the world first, so victory subscribers see the new owner
+        if self.victory_tracker is not None:
+            self.victory_tracker.base_captured(old_owner, new_owner)
+        return base
+
+    def destroy_base(self, base_name: str):
+        """A base is destroyed"""
+        base = self.base(base_name)
+        del self._bases[base_name]
+        self._index.remove(base_name)
+        self._bases_by_owner[base.owner].discard(base_name)
+        if self.victory_tracker is not None:
+            self.victory_tracker.base_destroyed(base.owner)
+
+    def base(self, base_name: str) -> Base:
+        """Get a base by name"""
+        if base_name not in self._bases:
+            raise ValueError(f"Base {base_name} does not exist")
+        return self._bases[base_name]
+
+    def bases_of(self, owner: str) -> List[Base]:
+        """Get all bases owned by a civilisation"""
+        return [self._bases[name] for name in sorted(self._owned_bases(owner))]
+
+    def bases_within(self, base_name: str, radius: float) -> List[Tuple[float, Base]]:
+        """Get (distance, base) of the other bases within a radius, nearest first"""
+        base = self.base(base_name)
+        return self._resolve(self._index.within(base.x, base.y, radius,
+                                                lambda name: name != base_name))
+
+    def nearest_bases(self, base_name: str, k: int) -> List[Tuple[float, Base]]:
+        """Get (distance, base) of the k nearest other bases, nearest first"""
+        base = self.base(base_name)
+        return self._resolve(self._index.nearest(base.x, base.y, k,
+                                                 lambda name: name != base_name))
+
+    def attack_targets(self, base_name: str, radius: Optional[float] = None,
+                       k: Optional[int] = None) -> List[Tuple[float, Base]]:
+        """Get (distance, base) of enemy bases a base can attack, nearest first.
+
+        Targets are limited to a radius, to the k nearest, or both.
+        """
+        if radius is None and k is None:
+            raise ValueError("Either radius or k is required")
+        base = self.base(base_name)
+        is_enemy = lambda name: self._bases[name].owner != base.owner
+        if radius is not None:
+            targets = self._index.within(base.x, base.y, radius, is_enemy)
+            return self._resolve(targets[:k] if k is not None else targets)
+        return self._resolve(self._index.nearest(base.x, base.y, k, is_enemy))
+
+    def neighbouring_civilisations(self, owner: str, radius: float) -> Set[str]:
+        """Get the civilisations with a base within a radius of any base of a civilisation"""
+        neighbours = set()
+        for base in self.bases_of(owner):
+            for _, other in self.bases_within(base.name, radius):
+                if other.owner != owner:
+                    neighbours.add(other.owner)
+        return neighbours
+
+    def _check_new_base_name(self, base_name: str):
+        if base_name in self._bases:
+            raise ValueError(f"Base {base_name} already exists")
+
+    def _add_base(self, base_name: str, owner: str, x: float, y: float) -> Base:
+        base = Base(base_name, owner, x, y)
+        self._bases[base_name] = base
+        self._bases_by_owner[owner].add(base_name)
+        self._index.insert(base_name, x, y)
+        return base
+
+    def _owned_bases(self, owner: str) -> Set[str]:
+        if owner not in self._bases_by_owner:
+            raise ValueError(f"Civilisation {owner} does not exist")
+        return self._bases_by_owner[owner]
+
+    def _living_bases(self, owner: str) -> Set[str]:
+        # A civilisation without bases is destroyed
+        bases = self._owned_bases(owner)
+        if not bases:
+            raise ValueError(f"Civilisation {owner} is destroyed")
+        return bases
+
+    def _resolve(self, results: List[Tuple[float, str]]) -> List[Tuple[float, Base]]:
+        return [(distance, self._bases[name]) for distance, name in results]
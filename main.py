@@ -1,9 +1,12 @@
 import sys
 from PySide6.QtWidgets import QApplication
 from ui.start_screen import StartScreen
-from ui.civilisation_generation_screen import CivilisationGenerationScreen
+from ui.civilisation_generation_screen import CivilisationGenerationScreen, TABLES_DIR
 from ui.navigation import NavigationManager
 from config.container import Container
+from data.table_file import read_table
+from data.table_registry import TableRegistry
+from data.table_watcher import TableWatcher
 
 def main():
     # Create dependency injection container
@@ -12,13 +15,24 @@ def main():
     # Create Qt application
     app = QApplication(sys.argv)
     
+    # Create shared table registry
+    table_registry = TableRegistry()
+    
+    # In watch mode, hot reload tables when their files are edited
+    if "--watch" in sys.argv:
+        table_loader = container.table_loader()
+        table_watcher = TableWatcher(
+            table_registry, TABLES_DIR,
+            lambda file_path, dice_sides: read_table(file_path, table_loader.dice_factory, dice_sides))
+        table_watcher.start()
+    
     # Create navigation manager
     nav_manager = NavigationManager()
     
     # Register screens with dependencies
     nav_manager.register_screen("start", lambda: StartScreen())
     nav_manager.register_screen("civilisation_generation", 
-                              lambda: CivilisationGenerationScreen(container.table_loader()))
+                              lambda: CivilisationGenerationScreen(container.table_loader(), table_registry))
     
     # Start with the start screen
     nav_manager.navigate_to("start")
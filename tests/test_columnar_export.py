@@ -0,0 +1,94 @@
+import json
+import random
+import pytest
+from data.columnar_export import ColumnarWriter, read_batches, read_histograms
+
+BACKGROUND_TABLES = ["elements", "general_professions", "modern_cultures", "social_classes"]
+
+def generate_civilisations(count, seed=1):
+    """Yield civilisation records with 1-4 backgrounds like the generator does."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        background_count = rng.choices([1, 2, 3, 4], weights=[10, 60, 20, 10])[0]
+        tables = rng.sample(BACKGROUND_TABLES, background_count)
+        record = {"background_count": background_count, "age": rng.randint(1, 5000)}
+        for table in tables:
+            record[table] = f"{table} {rng.randint(1, 5)}"
+        yield record
+
+def test_batches_are_dictionary_encoded(tmp_path):
+    """Test that batches hold codes and only the dictionary values new in that batch."""
+    path = tmp_path / "civilisations.jsonl"
+    with ColumnarWriter(path, ["elements"], ["age"], batch_size=2) as writer:
+        writer.write({"elements": "Fire", "age": 10})
+        writer.write({"elements": "Water", "age": 20})
+        writer.write({"elements": "Fire", "age": 30})
+        writer.write({"age": 40})
+
+    lines = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert lines[0]["dictionaries"] == {"elements": ["Fire", "Water"]}
+    assert lines[0]["columns"] == {"elements": [0, 1], "age": [10, 20]}
+    assert lines[1]["dictionaries"] == {"elements": []}
+    assert lines[1]["columns"] == {"elements": [0, -1], "age": [30, 40]}
+
+    batches = list(read_batches(path))
+    assert batches[1]["dictionaries"]["elements"] == ["Fire", "Water"]
+
+def test_histograms_match_while_writing_and_reading(tmp_path):
+    """Test that running and read-back histograms agree for bulk generation."""
+    path = tmp_path / "civilisations.jsonl"
+    with ColumnarWriter(path, BACKGROUND_TABLES + ["background_count"], ["age"],
+                        batch_size=1000) as writer:
+        writer.write_all(generate_civilisations(10_000))
+
+    histograms = read_histograms(path)
+    assert writer.row_count == 10_000
+    for column in BACKGROUND_TABLES + ["background_count"]:
+        assert histograms[column] == writer.histogram(column)
+        assert sum(histograms[column].values()) == 10_000
+
+    # Backgrounds should roughly follow the 10/60/20/10% split
+    counts = histograms["background_count"]
+    assert 0.55 < counts[2] / 10_000 < 0.65
+
+def test_read_selected_histograms(tmp_path):
+    path = tmp_path / "civilisations.jsonl"
+    with ColumnarWriter(path, BACKGROUND_TABLES) as writer:
+        writer.write_all(generate_civilisations(100))
+
+    assert list(read_histograms(path, ["elements"])) == ["elements"]
+
+def test_read_histograms_rejects_non_categorical_columns(tmp_path):
+    path = tmp_path / "civilisations.jsonl"
+    with ColumnarWriter(path, BACKGROUND_TABLES, ["age"]) as writer:
+        writer.write_all(generate_civilisations(10))
+
+    with pytest.raises(ValueError, match="age, unknown"):
+        read_histograms(path, ["elements", "age", "unknown"])
+
+def test_list_values_are_rejected_without_partial_write(tmp_path):
+    """Test that multiple values in one categorical column are rejected cleanly."""
+    path = tmp_path / "civilisations.jsonl"
+    with ColumnarWriter(path, ["elements", "modern_cultures"]) as writer:
+        with pytest.raises(TypeError, match="modern_cultures"):
+            writer.write({"elements": "Fire", "modern_cultures": ["German", "Japanese"]})
+        writer.write({"elements": "Water"})
+
+    assert writer.row_count == 1
+    assert read_histograms(path) == {"elements": {"Water": 1}, "modern_cultures": {None: 1}}
+
+@pytest.mark.parametrize("record", [
+    {"elements": True},
+    {"elements": "Fire", "age": "old"},
+    {"elements": "Fire", "age": False},
+])
+def test_invalid_values_are_rejected(tmp_path, record):
+    """Test that booleans and non-numeric values cannot be mixed into the columns."""
+    path = tmp_path / "civilisations.jsonl"
+    with ColumnarWriter(path, ["elements"], ["age"]) as writer:
+        writer.write({"elements": 1, "age": 10})
+        with pytest.raises(TypeError):
+            writer.write(record)
+
+    assert writer.row_count == 1
+    assert writer.histogram("elements") == {1: 1}
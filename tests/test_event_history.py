@@ -0,0 +1,105 @@
+import time
+import pytest
+from PySide6.QtCore import Qt
+from domain.event_history import EventLog
+from ui.components.event_history_view import EventHistoryModel, EventHistoryView
+
+@pytest.fixture
+def event_log():
+    log = EventLog()
+    log.append(1, "The civilisation was founded")
+    log.append(2, "A new base was founded on Mars")
+    log.append(3, "War declared against the Martians")
+    return log
+
+def test_search_uses_all_query_words(event_log):
+    """Test that search returns positions of entries containing every word."""
+    assert event_log.search("founded") == [0, 1]
+    assert event_log.search("FOUNDED mars") == [1]
+    assert event_log.search("founded war") == []
+    assert event_log.search("unknown") == []
+
+def test_search_matches_word_prefixes(event_log):
+    """Test that partially typed words already find entries."""
+    assert event_log.search("fou") == [0, 1]
+    assert event_log.search("fou ma") == [1]
+    assert event_log.search("m") == [1, 2]
+    assert event_log.matches(2, "war mart")
+    assert not event_log.matches(2, "founded")
+
+def test_empty_query_means_no_filter(event_log):
+    assert event_log.search("  ") is None
+
+def test_model_appends_single_row(qtbot, event_log):
+    """Test that appending inserts one row at the end instead of resetting."""
+    model = EventHistoryModel(event_log)
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    model.append_event(4, "Peace treaty signed")
+
+    assert inserted == [(3, 3)]
+    assert model.rowCount() == 4
+    assert model.data(model.index(3), Qt.DisplayRole) == "Turn 4: Peace treaty signed"
+
+def test_model_filter_follows_appends(qtbot, event_log):
+    """Test that a filtered model only shows and appends matching entries."""
+    model = EventHistoryModel(event_log)
+    model.set_filter("founded")
+    assert model.rowCount() == 2
+
+    model.append_event(4, "Peace treaty signed")
+    assert model.rowCount() == 2
+
+    model.append_event(5, "Second base founded")
+    assert model.rowCount() == 3
+    assert model.data(model.index(2), Qt.UserRole).turn == 5
+
+    model.set_filter("")
+    assert model.rowCount() == 5
+
+@pytest.mark.ui
+def test_view_handles_long_history(qtbot):
+    """Test that the view stays usable with a very long history."""
+    log = EventLog()
+    for turn in range(100_000):
+        log.append(turn, f"Event number {turn}")
+    view = EventHistoryView(log)
+    qtbot.addWidget(view)
+    view.show()
+
+    view.append_event(100_000, "Final event")
+    assert view.model.rowCount() == 100_001
+
+    qtbot.keyClicks(view.search_field, "fin")
+    assert view.model.rowCount() == 100_001  # Filter waits until typing pauses
+    qtbot.waitUntil(lambda: view.model.rowCount() == 1, timeout=2000)
+
+@pytest.mark.ui
+def test_view_applies_filter_on_return(qtbot, event_log):
+    view = EventHistoryView(event_log, search_delay_ms=10_000)
+    qtbot.addWidget(view)
+
+    qtbot.keyClicks(view.search_field, "war")
+    assert view.model.rowCount() == 3
+    qtbot.keyClick(view.search_field, Qt.Key_Return)
+    assert view.model.rowCount() == 1
+
+def test_append_cost_does_not_grow_with_vocabulary():
+    """Test that appending entries with new words stays O(1) in a large log."""
+    def time_appends(log, first_turn):
+        start = time.perf_counter()
+        for turn in range(first_turn, first_turn + 2000):
+            log.append(turn, f"Base{turn} founded in turn {turn}")
+        return time.perf_counter() - start
+
+    log = EventLog()
+    small_vocabulary = min(time_appends(log, turn) for turn in (0, 2000, 4000))
+    for turn in range(6000, 200_000):
+        log.append(turn, f"Base{turn} founded in turn {turn}")
+    log.search("base")  # Merge the new tokens once
+    large_vocabulary = min(time_appends(log, turn) for turn in (300_000, 302_000, 304_000))
+
+    assert large_vocabulary < small_vocabulary * 5
+    # Tokens appended after the last search are still found
+    assert len(log.search("base30400")) == 11
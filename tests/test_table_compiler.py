@@ -0,0 +1,144 @@
+import json
+from data.table_compiler import lint_table, main
+from data.table_format import (COMPILED_TABLES_FILE, COMPILED_FORMAT_VERSION, DICE_SIDES_FILE,
+                               load_dice_sides, is_compiled_cache_current, hash_table_file)
+
+def write_table(directory, name, text):
+    path = directory / f"{name}.csv"
+    path.write_text(text, encoding='utf-8')
+    return path
+
+def test_valid_table(tmp_path):
+    path = write_table(tmp_path, "elements", "min_roll,max_roll,text\n51,100,Water\n1,50,Fire\n")
+    report = lint_table(path)
+    assert report.is_valid
+    assert report.entries == [(1, 50, "Fire"), (51, 100, "Water")]
+
+def test_wrong_header(tmp_path):
+    """Test that single-column tables are rejected."""
+    path = write_table(tmp_path, "elements", "Element\nFire\nWater\n")
+    report = lint_table(path)
+    assert report.errors == ["expected columns min_roll, max_roll, text but found Element"]
+
+def test_invalid_rows(tmp_path):
+    path = write_table(tmp_path, "elements",
+                       "min_roll,max_roll,text\n"
+                       "one,50,Fire\n"
+                       "51,100,\n"
+                       "60,55,Air\n")
+    report = lint_table(path)
+    assert report.errors[:3] == [
+        "line 2: min_roll is not an integer: 'one'",
+        "line 3: missing text",
+        "line 4: min_roll 60 is greater than max_roll 55",
+    ]
+
+def test_overlaps_and_coverage_gaps(tmp_path):
+    """Test that overlapping ranges and uncovered rolls are reported."""
+    path = write_table(tmp_path, "elements",
+                       "min_roll,max_roll,text\n"
+                       "1,10,Fire\n"
+                       "5,12,Water\n"
+                       "15,18,Earth\n")
+    report = lint_table(path, dice_sides=20)
+    assert report.errors == [
+        "range 5-12 (Water) overlaps 1-10 (Fire)",
+        "rolls 13-14 are not covered",
+        "rolls 19-20 are not covered",
+    ]
+
+def test_range_outside_dice(tmp_path):
+    path = write_table(tmp_path, "elements", "min_roll,max_roll,text\n1,12,Fire\n")
+    report = lint_table(path, dice_sides=10)
+    assert report.errors == ["line 2: range 1-12 is outside of 1-10"]
+
+def test_main_writes_compiled_tables(tmp_path):
+    """Test that the CLI lints all tables and writes the compiled cache."""
+    write_table(tmp_path, "elements", "min_roll,max_roll,text\n1,6,Fire\n")
+    write_table(tmp_path, "cultures", "min_roll,max_roll,text\n1,3,German\n4,12,Japanese\n")
+    (tmp_path / DICE_SIDES_FILE).write_text('{"elements": 6, "cultures": 12}', encoding='utf-8')
+
+    assert main([str(tmp_path), "-j", "2"]) == 0
+
+    compiled = json.loads((tmp_path / COMPILED_TABLES_FILE).read_text(encoding='utf-8'))
+    assert compiled["version"] == COMPILED_FORMAT_VERSION
+    cultures = compiled["tables"]["cultures"]
+    assert cultures["dice_sides"] == 12
+    assert cultures["entries"] == [[1, 3, "German"], [4, 12, "Japanese"]]
+    assert cultures["sha256"] == hash_table_file(tmp_path / "cultures.csv")
+    assert compiled["tables"]["elements"]["dice_sides"] == 6
+
+def test_main_fails_without_writing_on_errors(tmp_path, capsys):
+    write_table(tmp_path, "elements", "Element\nFire\n")
+
+    assert main([str(tmp_path)]) == 1
+
+    assert "expected columns" in capsys.readouterr().out
+    assert not (tmp_path / COMPILED_TABLES_FILE).exists()
+
+def test_main_rejects_invalid_dice_sides(tmp_path, capsys):
+    write_table(tmp_path, "elements", "min_roll,max_roll,text\n1,6,Fire\n")
+    (tmp_path / DICE_SIDES_FILE).write_text('{"elements": "d6", "cultures": 12}', encoding='utf-8')
+
+    assert main([str(tmp_path)]) == 1
+
+    output = capsys.readouterr().out
+    assert "dice sides of elements must be a positive integer: 'd6'" in output
+    assert "dice sides declared for unknown table cultures" in output
+
+def test_runtime_dice_sides_skip_invalid_declarations(tmp_path):
+    """Test that the runtime loader drops invalid declarations instead of raising."""
+    (tmp_path / DICE_SIDES_FILE).write_text('{"elements": 12, "cultures": "d12"}', encoding='utf-8')
+
+    dice_sides, errors = load_dice_sides(tmp_path)
+
+    assert dice_sides == {"elements": 12}
+    assert errors == ["dice sides of cultures must be a positive integer: 'd12'"]
+
+def test_runtime_dice_sides_of_malformed_file(tmp_path):
+    (tmp_path / DICE_SIDES_FILE).write_text('{"elements": 12', encoding='utf-8')
+
+    dice_sides, errors = load_dice_sides(tmp_path)
+
+    assert dice_sides == {}
+    assert "is not valid JSON" in errors[0]
+
+def test_compiled_cache_detects_edited_tables(tmp_path):
+    """Test that the cache is only current for the files it was built from."""
+    elements = write_table(tmp_path, "elements", "min_roll,max_roll,text\n1,100,Fire\n")
+    assert main([str(tmp_path)]) == 0
+
+    def compiled():
+        return json.loads((tmp_path / COMPILED_TABLES_FILE).read_text(encoding='utf-8'))
+
+    assert is_compiled_cache_current(compiled(), tmp_path, load_dice_sides(tmp_path)[0])
+
+    elements.write_text("min_roll,max_roll,text\n1,100,Water\n", encoding='utf-8')
+    assert not is_compiled_cache_current(compiled(), tmp_path, load_dice_sides(tmp_path)[0])
+
+    assert main([str(tmp_path)]) == 0
+    write_table(tmp_path, "cultures", "min_roll,max_roll,text\n1,100,German\n")
+    assert not is_compiled_cache_current(compiled(), tmp_path, load_dice_sides(tmp_path)[0])
+
+    assert main([str(tmp_path)]) == 0
+    (tmp_path / DICE_SIDES_FILE).write_text('{"elements": 12}', encoding='utf-8')
+    assert not is_compiled_cache_current(compiled(), tmp_path, load_dice_sides(tmp_path)[0])
+
+def test_compiled_cache_of_other_version_is_not_current(tmp_path):
+    write_table(tmp_path, "elements", "min_roll,max_roll,text\n1,100,Fire\n")
+    assert main([str(tmp_path)]) == 0
+    compiled = json.loads((tmp_path / COMPILED_TABLES_FILE).read_text(encoding='utf-8'))
+
+    compiled["version"] = COMPILED_FORMAT_VERSION - 1
+    assert not is_compiled_cache_current(compiled, tmp_path, {})
+
+def test_unreadable_table_does_not_stop_linting(tmp_path, capsys):
+    """Test that a file with invalid UTF-8 is reported as that table's error."""
+    (tmp_path / "broken.csv").write_bytes(b"min_roll,max_roll,text\n1,100,\xff\xfe\n")
+    write_table(tmp_path, "elements", "min_roll,max_roll,text\n1,50,Fire\n")
+
+    assert main([str(tmp_path)]) == 1
+
+    output = capsys.readouterr().out
+    assert "broken.csv: file is not valid UTF-8" in output
+    assert "elements.csv: rolls 51-100 are not covered" in output
@@ -0,0 +1,122 @@
+import os
+import pytest
+from data.table_registry import TableRegistry
+from data.table_watcher import TableWatcher
+
+def write_table(path, text):
+    path.write_text(text, encoding='utf-8')
+
+@pytest.fixture
+def table_dir(tmp_path):
+    write_table(tmp_path / "elements.csv", "min_roll,max_roll,text\n1,100,Fire\n")
+    write_table(tmp_path / "cultures.csv", "min_roll,max_roll,text\n1,100,German\n")
+    return tmp_path
+
+@pytest.fixture
+def registry(qtbot):
+    return TableRegistry()
+
+@pytest.fixture
+def loaded():
+    """Record every file the watcher parses."""
+    return []
+
+@pytest.fixture
+def watcher(qtbot, registry, table_dir, loaded):
+    def load_table(file_path, dice_sides):
+        content = file_path.read_text(encoding='utf-8')
+        if "broken" in content:
+            raise ValueError("invalid literal for int()")
+        loaded.append(file_path.stem)
+        return f"{content}d{dice_sides}"
+
+    registry.replace_all({path.stem: path.read_text() for path in table_dir.glob("*.csv")})
+    watcher = TableWatcher(registry, str(table_dir), load_table, debounce_ms=10)
+    watcher.start()
+    yield watcher
+    watcher.stop()
+
+def test_registry_replace_swaps_dictionary(qtbot, registry):
+    """Test that a replace never mutates a snapshot handed out before."""
+    registry.replace_all({"elements": "old"})
+    snapshot = registry.snapshot()
+
+    with qtbot.waitSignal(registry.table_updated) as blocker:
+        registry.replace("elements", "new")
+
+    assert blocker.args == ["elements"]
+    assert snapshot == {"elements": "old"}
+    assert registry.get("elements") == "new"
+
+def test_replace_all_emits_single_signal(qtbot, registry):
+    """Test that publishing all tables does not notify once per table."""
+    updated = []
+    registry.table_updated.connect(updated.append)
+
+    with qtbot.waitSignal(registry.tables_replaced):
+        registry.replace_all({"elements": "Fire", "cultures": "German"})
+
+    assert updated == []
+    assert registry.snapshot() == {"elements": "Fire", "cultures": "German"}
+
+def test_only_changed_table_is_reloaded(qtbot, registry, watcher, table_dir, loaded):
+    """Test that editing one file reloads only that table."""
+    untouched = registry.get("cultures")
+
+    with qtbot.waitSignal(registry.table_updated, timeout=2000) as blocker:
+        write_table(table_dir / "elements.csv", "min_roll,max_roll,text\n1,100,Water\n")
+
+    assert blocker.args == ["elements"]
+    assert "Water" in registry.get("elements")
+    assert registry.get("cultures") is untouched
+    assert loaded == ["elements"]
+
+def test_unchanged_file_is_not_parsed(qtbot, watcher, table_dir, loaded):
+    """Test that a change notification without a content change is ignored."""
+    watcher._on_path_changed(str(table_dir / "cultures.csv"))
+    watcher.reload_pending()
+    assert loaded == []
+
+def test_failed_reload_keeps_previous_version(qtbot, registry, watcher, table_dir):
+    """Test that a broken edit keeps the old table and reports the error."""
+    previous = registry.get("elements")
+
+    with qtbot.waitSignal(watcher.reload_failed, timeout=2000) as blocker:
+        write_table(table_dir / "elements.csv", "min_roll,max_roll,text\nbroken\n")
+
+    assert blocker.args[0] == "elements"
+    assert registry.get("elements") is previous
+
+def test_added_and_removed_tables(qtbot, registry, watcher, table_dir):
+    """Test that new files are loaded and deleted files are removed."""
+    with qtbot.waitSignal(registry.table_updated, timeout=2000) as blocker:
+        write_table(table_dir / "social_classes.csv", "min_roll,max_roll,text\n1,100,Slave\n")
+    assert blocker.args == ["social_classes"]
+
+    with qtbot.waitSignal(registry.table_removed, timeout=2000) as blocker:
+        os.remove(table_dir / "cultures.csv")
+    assert blocker.args == ["cultures"]
+    assert registry.get("cultures") is None
+
+def test_dice_sides_change_reloads_affected_tables(qtbot, registry, watcher, table_dir, loaded):
+    """Test that declaring new dice sides reloads only the tables using them."""
+    untouched = registry.get("cultures")
+
+    with qtbot.waitSignal(registry.table_updated, timeout=2000) as blocker:
+        (table_dir / "dice_sides.json").write_text('{"elements": 12}', encoding='utf-8')
+
+    assert blocker.args == ["elements"]
+    assert registry.get("elements").endswith("d12")
+    assert registry.get("cultures") is untouched
+    assert loaded == ["elements"]
+
+def test_malformed_dice_sides_use_default(qtbot, registry, watcher, table_dir):
+    """Test that a broken dice sides file is reported and tables fall back to the default."""
+    with qtbot.waitSignal(registry.table_updated, timeout=2000):
+        (table_dir / "dice_sides.json").write_text('{"elements": 12}', encoding='utf-8')
+
+    with qtbot.waitSignal(watcher.reload_failed, timeout=2000) as blocker:
+        (table_dir / "dice_sides.json").write_text('{"elements": 12', encoding='utf-8')
+    assert blocker.args[0] == "dice_sides"
+
+    qtbot.waitUntil(lambda: registry.get("elements").endswith("d100"), timeout=2000)
@@ -0,0 +1,98 @@
+import pytest
+from domain.victory_tracker import (VictoryTracker, WAR_VICTORY, TRANSCENDENCE_VICTORY,
+                                    CULTURAL_VICTORY)
+
+@pytest.fixture
+def tracker(qtbot):
+    tracker = VictoryTracker(transcendence_techs=3, cultural_pressure=100)
+    tracker.add_civilisation("Terrans", base_count=2)
+    tracker.add_civilisation("Martians")
+    tracker.add_civilisation("Venusians")
+    return tracker
+
+def test_losing_last_base_destroys_civilisation(qtbot, tracker):
+    with qtbot.waitSignal(tracker.civilisation_destroyed) as blocker:
+        tracker.base_captured("Martians", "Terrans")
+
+    assert blocker.args == ["Martians"]
+    assert tracker.status("Terrans").base_count == 3
+    assert tracker.alive_count == 2
+    assert not tracker.is_game_over
+
+def test_war_victory_when_one_civilisation_is_left(qtbot, tracker):
+    """Test that destroying all other civilisations is a war victory."""
+    tracker.base_captured("Martians", "Terrans")
+    with qtbot.waitSignal(tracker.victory) as blocker:
+        tracker.base_destroyed("Venusians")
+
+    assert blocker.args == ["Terrans", WAR_VICTORY]
+    assert tracker.winner == ("Terrans", WAR_VICTORY)
+
+def test_transcendence_victory(qtbot, tracker):
+    tracker.tech_learned("Venusians", 2)
+    assert not tracker.is_game_over
+
+    with qtbot.waitSignal(tracker.victory) as blocker:
+        tracker.tech_learned("Venusians")
+    assert blocker.args == ["Venusians", TRANSCENDENCE_VICTORY]
+
+def test_cultural_victory_uses_total_outgoing_pressure(qtbot, tracker):
+    """Test that pressure updates replace the previous value for the same target."""
+    tracker.set_pressure("Martians", "Terrans", 60)
+    tracker.set_pressure("Martians", "Terrans", 30)
+    assert tracker.status("Martians").outgoing_pressure == 30
+
+    with qtbot.waitSignal(tracker.victory) as blocker:
+        tracker.set_pressure("Martians", "Venusians", 70)
+    assert blocker.args == ["Martians", CULTURAL_VICTORY]
+
+def test_only_first_victory_is_reported(qtbot, tracker):
+    victories = []
+    tracker.victory.connect(lambda name, kind: victories.append((name, kind)))
+
+    tracker.tech_learned("Terrans", 3)
+    tracker.tech_learned("Martians", 3)
+
+    assert victories == [("Terrans", TRANSCENDENCE_VICTORY)]
+
+def test_all_destroyed(qtbot):
+    tracker = VictoryTracker()
+    tracker.add_civilisation("Terrans")
+
+    with qtbot.waitSignal(tracker.all_destroyed):
+        tracker.base_destroyed("Terrans")
+    assert tracker.is_game_over
+    assert tracker.winner is None
+
+def test_destroyed_civilisation_cannot_act(qtbot, tracker):
+    tracker.base_destroyed("Martians")
+    with pytest.raises(ValueError):
+        tracker.base_founded("Martians")
+
+def test_pressure_needs_living_target(qtbot, tracker):
+    with pytest.raises(ValueError):
+        tracker.set_pressure("Martians", "Plutonians", 200)
+    tracker.base_destroyed("Venusians")
+    with pytest.raises(ValueError):
+        tracker.set_pressure("Martians", "Venusians", 200)
+    assert tracker.status("Martians").outgoing_pressure == 0
+
+def test_pressure_on_destroyed_civilisation_is_removed(qtbot):
+    """Test that pressure on a destroyed civilisation no longer counts for cultural victory."""
+    tracker = VictoryTracker(cultural_pressure=100)
+    for name in ["X", "Y", "Z"]:
+        tracker.add_civilisation(name)
+    tracker.add_civilisation("W", base_count=2)
+    tracker.set_pressure("X", "Y", 90)
+    tracker.set_pressure("Y", "X", 50)
+
+    tracker.base_destroyed("Y")
+    assert tracker.status("X").outgoing_pressure == 0
+
+    tracker.set_pressure("X", "Z", 20)
+    assert not tracker.is_game_over
+
+def test_capture_from_unknown_owner_changes_nothing(qtbot, tracker):
+    with pytest.raises(ValueError):
+        tracker.base_captured("Plutonians", "Terrans")
+    assert tracker.status("Terrans").base_count == 2
@@ -0,0 +1,110 @@
+import math
+import random
+import pytest
+from domain.spatial_index import SpatialIndex
+from domain.victory_tracker import VictoryTracker, WAR_VICTORY
+from domain.world import World
+
+def brute_force_nearest(points, x, y, k):
+    distances = sorted(math.hypot(px - x, py - y) for px, py in points.values())
+    return distances[:k]
+
+def test_index_matches_brute_force():
+    """Test that radius and k-nearest queries agree with an all-pairs scan."""
+    rng = random.Random(7)
+    index = SpatialIndex(cell_size=5)
+    points = {}
+    for key in range(2000):
+        points[key] = (rng.uniform(-100, 100), rng.uniform(-100, 100))
+        index.insert(key, *points[key])
+    for key in range(0, 2000, 3):
+        index.remove(key)
+        del points[key]
+
+    for _ in range(50):
+        x, y = rng.uniform(-120, 120), rng.uniform(-120, 120)
+        nearest = [distance for distance, _ in index.nearest(x, y, 7)]
+        assert nearest == pytest.approx(brute_force_nearest(points, x, y, 7))
+
+        within = {key for _, key in index.within(x, y, 12)}
+        expected = {key for key, (px, py) in points.items() if math.hypot(px - x, py - y) <= 12}
+        assert within == expected
+
+def test_nearest_in_sparse_grid():
+    index = SpatialIndex(cell_size=1)
+    index.insert("near", 0, 0)
+    index.insert("far", 10_000, 10_000)
+    assert [key for _, key in index.nearest(5_000, 5_000, 1)] == ["near"]
+    assert index.nearest(0, 0, 5)[1][1] == "far"
+
+def test_within_large_radius_in_sparse_grid():
+    """Test that a huge query box does not visit every empty cell."""
+    index = SpatialIndex(cell_size=1)
+    index.insert("base", 3, 4)
+    index.insert("far", 5000, 5000)
+
+    assert index.within(0, 0, 2000) == [(5.0, "base")]
+    assert len(index.within(0, 0, 10_000_000)) == 2
+
+@pytest.fixture
+def world(qtbot):
+    world = World(VictoryTracker(), cell_size=10)
+    world.add_civilisation("Terrans", "Earth", 0, 0)
+    world.found_base("Moon", "Terrans", 3, 0)
+    world.add_civilisation("Martians", "Olympus", 20, 0)
+    world.add_civilisation("Venusians", "Ishtar", -8, 0)
+    return world
+
+def test_attack_targets_exclude_own_bases(world):
+    targets = world.attack_targets("Earth", radius=25)
+    assert [base.name for _, base in targets] == ["Ishtar", "Olympus"]
+    assert [base.name for _, base in world.attack_targets("Earth", k=1)] == ["Ishtar"]
+
+def test_neighbouring_civilisations(world):
+    assert world.neighbouring_civilisations("Terrans", 10) == {"Venusians"}
+    assert world.neighbouring_civilisations("Terrans", 20) == {"Venusians", "Martians"}
+
+def test_capture_updates_queries_and_tracker(qtbot, world):
+    """Test that captured and destroyed bases are reflected immediately."""
+    world.capture_base("Ishtar", "Terrans")
+    assert [base.name for _, base in world.attack_targets("Earth", radius=25)] == ["Olympus"]
+    assert world.victory_tracker.status("Terrans").base_count == 3
+
+    with qtbot.waitSignal(world.victory_tracker.victory) as blocker:
+        world.destroy_base("Olympus")
+    assert blocker.args == ["Terrans", WAR_VICTORY]
+    assert world.nearest_bases("Earth", 5)[-1][1].name == "Ishtar"
+
+def test_unknown_civilisation(world):
+    with pytest.raises(ValueError):
+        world.found_base("Titan", "Saturnians", 50, 50)
+
+def test_duplicate_base_name_changes_nothing(world):
+    """Test that a rejected base leaves the tracker and the world in agreement."""
+    with pytest.raises(ValueError):
+        world.found_base("Earth", "Terrans", 50, 50)
+    with pytest.raises(ValueError):
+        world.add_civilisation("Plutonians", "Earth", 50, 50)
+
+    assert world.victory_tracker.status("Terrans").base_count == len(world.bases_of("Terrans"))
+    with pytest.raises(ValueError):
+        world.bases_of("Plutonians")
+    with pytest.raises(KeyError):
+        world.victory_tracker.status("Plutonians")
+
+def test_victory_subscribers_see_captured_base(qtbot, world):
+    """Test that the world is updated before the tracker emits its signals."""
+    world.destroy_base("Ishtar")
+    owners = []
+    world.victory_tracker.victory.connect(
+        lambda name, kind: owners.append(world.base("Olympus").owner))
+
+    world.capture_base("Olympus", "Terrans")
+
+    assert owners == ["Terrans"]
+
+def test_destroyed_civilisation_cannot_capture(world):
+    world.destroy_base("Ishtar")
+    with pytest.raises(ValueError):
+        world.capture_base("Olympus", "Venusians")
+    assert world.base("Olympus").owner == "Martians"
@@ -3,13 +3,17 @@ from PySide6.QtCore import Qt, QThread, Signal
 from ui.base_screen import BaseScreen
 from ui.components.progress_button import ProgressButton
 from data.table_loader import TableLoader
+from data.table_file import read_table, read_compiled_tables
+from data.table_format import COMPILED_TABLES_FILE, DEFAULT_DICE_SIDES, load_dice_sides
+from data.table_registry import TableRegistry
 from domain.table import Table
-from typing import Dict
+from typing import Dict, Optional
 import os
 from pathlib import Path
-import csv
 from ui.styles.button_styles import get_sci_fi_button_style
 
+TABLES_DIR = "data/tables"
+
 class TableLoadingThread(QThread):
     finished = Signal(dict)
     progress = Signal(int)
@@ -20,8 +24,29 @@ class TableLoadingThread(QThread):
         self.data_dir = data_dir
     
     def run(self):
-        # Count the total number of files to be loaded
         data_path = Path(self.data_dir)
+        
+        # Read the declared dice sides once, broken declarations fall back to the default
+        dice_sides, dice_sides_errors = load_dice_sides(data_path)
+        for error in dice_sides_errors:
+            print(f"Using d{DEFAULT_DICE_SIDES} instead of declared dice sides: {error}")
+        
+        # Prefer the cache written by the table compiler, it is already validated
+        compiled_path = data_path / COMPILED_TABLES_FILE
+        if compiled_path.exists():
+            print(f"Loading compiled tables from: {compiled_path.absolute()}")
+            try:
+                tables = read_compiled_tables(compiled_path, self.table_loader.dice_factory,
+                                              dice_sides)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                # Outdated or corrupt cache, parse the table files instead
+                print(f"Cannot use compiled tables: {e}")
+            else:
+                self.progress.emit(100)
+                self.finished.emit(tables)
+                return
+        
+        # Count the total number of files to be loaded
         print(f"Looking for table files in: {data_path.absolute()}")
         table_files = list(data_path.glob("*.csv"))
         total_files = len(table_files)
@@ -45,19 +70,8 @@ class TableLoadingThread(QThread):
             table_name = file_path.stem
             
             # Read the file and create a Table object
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                dice_sides = 100  # Default to d100, could be made configurable
-                
-                table = Table(table_name, self.table_loader.dice_factory.create_dice(dice_sides))
-                
-                for row in reader:
-                    min_roll = int(row['min_roll'])
-                    max_roll = int(row['max_roll'])
-                    text = row['text']
-                    table.add_entry(min_roll, max_roll, text)
-                
-                tables[table_name] = table
+            tables[table_name] = read_table(file_path, self.table_loader.dice_factory,
+                                            dice_sides.get(table_name, DEFAULT_DICE_SIDES))
             
             # Small sleep to allow UI updates
             self.msleep(10)
@@ -67,11 +81,18 @@ class TableLoadingThread(QThread):
         self.finished.emit(tables)
 
 class CivilisationGenerationScreen(BaseScreen):
-    def __init__(self, table_loader: TableLoader):
+    def __init__(self, table_loader: TableLoader, table_registry: Optional[TableRegistry] = None):
         super().__init__("Civilisation Generation")
         self.table_loader = table_loader
+        self.table_registry = table_registry
         self.tables: Dict[str, Table] = {}
         
+        # Pick up hot reloaded tables from the shared registry
+        if self.table_registry is not None:
+            self.table_registry.table_updated.connect(self._on_registry_changed)
+            self.table_registry.table_removed.connect(self._on_registry_changed)
+            self.table_registry.tables_replaced.connect(self._on_registry_replaced)
+        
         # Create Generate button with progress
         self.generate_button = ProgressButton("Generate")
         self.generate_button.setEnabled(False)
@@ -99,19 +120,30 @@ class CivilisationGenerationScreen(BaseScreen):
         self.generate_button.start_progress()
         
         # Create and start loading thread
-        self.loading_thread = TableLoadingThread(self.table_loader, "data/tables")
+        self.loading_thread = TableLoadingThread(self.table_loader, TABLES_DIR)
         self.loading_thread.progress.connect(self.generate_button.set_progress)
         self.loading_thread.finished.connect(self._on_tables_loaded)
         self.loading_thread.start()
     
     def _on_tables_loaded(self, tables: Dict[str, Table]):
         """Called when tables are loaded"""
+        if self.table_registry is not None:
+            self.table_registry.replace_all(tables)
         self.tables = tables
         print(f"Tables loaded: {len(tables)} tables found")
         for table_name in tables.keys():
             print(f"  - {table_name}")
         self.generate_button.set_enabled(True)
     
+    def _on_registry_changed(self, table_name: str):
+        """Called when a table was reloaded or removed in the registry"""
+        self.tables = self.table_registry.snapshot()
+        print(f"Table updated: {table_name}")
+    
+    def _on_registry_replaced(self):
+        """Called when all tables in the registry were replaced at once"""
+        self.tables = self.table_registry.snapshot()
+    
     def _on_generate(self):
         """Handle generate button click"""
         if not self.tables:
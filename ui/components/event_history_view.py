@@ -0,0 +1,114 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QListView, QAbstractItemView
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer
+from domain.event_history import EventLog
+from typing import List, Optional
+
+
+class EventHistoryModel(QAbstractListModel):
+    """Qt list model on top of an append-only EventLog.
+
+    Appending inserts a single row at the end instead of resetting the model,
+    so views only lay out what actually changed. An optional filter maps the
+    visible rows to log positions using the log's search index.
+    """
+
+    def __init__(self, event_log: Optional[EventLog] = None, parent=None):
+        super().__init__(parent)
+        self.event_log = event_log if event_log is not None else EventLog()
+        self._query = ""
+        self._visible: Optional[List[int]] = None  # None means unfiltered
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._visible is None:
+            return len(self.event_log)
+        return len(self._visible)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.event_log[self.position(index.row())]
+        if role == Qt.DisplayRole:
+            return f"Turn {entry.turn}: {entry.text}"
+        if role == Qt.UserRole:
+            return entry
+        return None
+
+    def position(self, row: int) -> int:
+        """Map a visible row to its position in the event log"""
+        return row if self._visible is None else self._visible[row]
+
+    def append_event(self, turn: int, text: str):
+        """Append an entry to the log and insert its row if it is visible"""
+        position = self.event_log.append(turn, text)
+        if self._visible is None:
+            self.beginInsertRows(QModelIndex(), position, position)
+            self.endInsertRows()
+        elif self.event_log.matches(position, self._query):
+            row = len(self._visible)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._visible.append(position)
+            self.endInsertRows()
+
+    def set_filter(self, query: str):
+        """Only show entries containing all words of the query"""
+        self.beginResetModel()
+        self._query = query
+        self._visible = self.event_log.search(query)
+        self.endResetModel()
+
+
+class EventHistoryView(QWidget):
+    """A searchable list showing the event history of a civilisation or leader.
+
+    Rows have uniform height, so the list view only lays out and paints the
+    visible rows, which keeps it responsive with very long histories. The
+    filter is applied once typing pauses instead of on every keystroke.
+    """
+
+    def __init__(self, event_log: Optional[EventLog] = None, search_delay_ms: int = 250,
+                 parent=None):
+        super().__init__(parent)
+        self.model = EventHistoryModel(event_log, self)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(search_delay_ms)
+        self._search_timer.timeout.connect(self.apply_filter)
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Create search field
+        self.search_field = QLineEdit()
+        self.search_field.setPlaceholderText("Search history...")
+        self.search_field.textChanged.connect(self._search_timer.start)
+        self.search_field.returnPressed.connect(self.apply_filter)
+
+        # Create list view
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setUniformItemSizes(True)  # Avoids measuring every row
+        self.list_view.setLayoutMode(QListView.Batched)
+        self.list_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.list_view.setWordWrap(False)
+
+        layout.addWidget(self.search_field)
+        layout.addWidget(self.list_view)
+
+    def apply_filter(self):
+        """Filter the history by the current search text"""
+        self._search_timer.stop()
+        self.model.set_filter(self.search_field.text())
+
+    def append_event(self, turn: int, text: str):
+        """Append an entry and keep following the newest one if already at the end"""
+        scroll_bar = self.list_view.verticalScrollBar()
+        at_end = scroll_bar.value() == scroll_bar.maximum()
+        self.model.append_event(turn, text)
+        if at_end:
+            self.list_view.scrollToBottom()